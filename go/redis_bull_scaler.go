@@ -11,6 +11,8 @@ import (
 	pb "github.com/avishay/redis-bull-scaler/externalscaler"
 	"github.com/go-redis/redis/v8"
 	"google.golang.org/grpc"
+	"google.golang.org/grpc/health"
+	healthpb "google.golang.org/grpc/health/grpc_health_v1"
 )
 
 // server implements the KEDA ExternalScaler gRPC interface
@@ -189,6 +191,9 @@ func main() {
 	}
 	grpcServer := grpc.NewServer()
 	pb.RegisterExternalScalerServer(grpcServer, NewServer())
+	// Standard gRPC health service for the Kubernetes readiness probe. NewServer()
+	// exits unless the first Redis PING succeeds, so it can report SERVING right away.
+	healthpb.RegisterHealthServer(grpcServer, health.NewServer())
 	log.Printf("Starting gRPC server on :%d", port)
 	if err := grpcServer.Serve(lis); err != nil {
 		log.Fatalf("Failed to serve: %v", err)
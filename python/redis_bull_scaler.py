@@ -1,34 +1,49 @@
+import asyncio
+import functools
 import grpc
-from concurrent import futures
 import redis
+from redis import asyncio as aioredis
+from redis.asyncio.retry import Retry
+from redis.backoff import ExponentialBackoff
 import os
 import logging
+import random
+import signal
+import socket
+import sys
 import time
+from prometheus_client import Gauge, Histogram, start_http_server
+from grpc_health.v1 import health, health_pb2, health_pb2_grpc
 import externalscaler_pb2
 import externalscaler_pb2_grpc
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
+# Configure logging - defaults to WARNING so the per-request INFO logs cost nothing.
+# Every entry carries the PID so output from forked server processes can be told apart.
+logging.basicConfig(
+    level=os.getenv("LOG_LEVEL", "WARNING").upper(),
+    format="%(levelname)s:%(name)s:%(process)d:%(message)s"
+)
+# Named explicitly so records look the same whether run as a script, with -m, or imported
+logger = logging.getLogger("redis_bull_scaler")
 
 # Configuration via environment variables - fail fast if not defined
 def get_required_env(var_name, var_type=str):
     value = os.getenv(var_name)
     if value is None:
-        logger.error(f"Required environment variable {var_name} is not set")
+        logger.error("Required environment variable %s is not set", var_name)
         raise ValueError(f"Missing required environment variable: {var_name}")
 
     if var_type == int:
         try:
             int_value = int(value)
             if var_name == "REDIS_PORT" and (int_value <= 0 or int_value > 65535):
-                logger.error(f"Environment variable {var_name} must be a valid port number (1-65535), got: {value}")
+                logger.error("Environment variable %s must be a valid port number (1-65535), got: %s", var_name, value)
                 raise ValueError(f"REDIS_PORT must be a valid port number (1-65535), got: {value}")
             return int_value
         except ValueError as e:
             if "valid port number" in str(e):
                 raise e
-            logger.error(f"Environment variable {var_name} must be an integer, got: {value}")
+            logger.error("Environment variable %s must be an integer, got: %s", var_name, value)
             raise ValueError(f"Invalid integer value for {var_name}: {value}")
 
     return value
@@ -37,54 +52,231 @@ def get_required_env(var_name, var_type=str):
 REDIS_HOST = get_required_env("REDIS_HOST")
 REDIS_PORT = get_required_env("REDIS_PORT", int)
 
-# Redis connection with verbose logging
-class VerboseRedis:
-    def __init__(self, redis_client):
-        self.redis_client = redis_client
+# Queue lengths of every pair seen recently are re-read in the background this often
+QUEUE_REFRESH_INTERVAL_MS = int(os.getenv("QUEUE_REFRESH_INTERVAL_MS", "250"))
 
-    def ping(self):
-        logger.info(f"[REDIS] Executing PING command to {REDIS_HOST}:{REDIS_PORT}")
-        try:
-            result = self.redis_client.ping()
-            logger.info(f"[REDIS] PING successful: {result}")
-            return result
-        except Exception as e:
-            logger.error(f"[REDIS] PING failed: {e}")
-            raise
+# Maximum age of queue lengths served from memory before a request reads Redis itself
+CACHE_TTL_MS = int(os.getenv("CACHE_TTL_MS", "500"))
 
-    def llen(self, key):
-        logger.info(f"[REDIS] Executing LLEN command for key: {key}")
-        try:
-            result = self.redis_client.llen(key)
-            logger.info(f"[REDIS] LLEN '{key}' returned: {result}")
-            return result
-        except Exception as e:
-            logger.error(f"[REDIS] LLEN '{key}' failed: {e}")
-            raise
+# Pairs not requested for this long are no longer refreshed
+QUEUE_IDLE_SECONDS = 300
+
+# Number of server processes sharing the gRPC port via SO_REUSEPORT
+SERVER_PROCESSES = int(os.getenv("SERVER_PROCESSES", "1"))
+
+# Seconds in-flight RPCs get to finish after SIGTERM
+SHUTDOWN_GRACE_SECONDS = float(os.getenv("SHUTDOWN_GRACE_SECONDS", "5"))
+
+# gRPC server tuning - scaler messages are tiny, and dead KEDA connections should be noticed promptly
+GRPC_MAX_MESSAGE_BYTES = int(os.getenv("GRPC_MAX_MESSAGE_BYTES", str(64 * 1024)))
+GRPC_KEEPALIVE_TIME_MS = int(os.getenv("GRPC_KEEPALIVE_TIME_MS", "30000"))
+GRPC_KEEPALIVE_TIMEOUT_MS = int(os.getenv("GRPC_KEEPALIVE_TIMEOUT_MS", "5000"))
+GRPC_MAX_CONCURRENT_STREAMS = int(os.getenv("GRPC_MAX_CONCURRENT_STREAMS", "100"))
+
+GRPC_SERVER_OPTIONS = [
+    ("grpc.max_receive_message_length", GRPC_MAX_MESSAGE_BYTES),
+    ("grpc.max_send_message_length", GRPC_MAX_MESSAGE_BYTES),
+    ("grpc.keepalive_time_ms", GRPC_KEEPALIVE_TIME_MS),
+    ("grpc.keepalive_timeout_ms", GRPC_KEEPALIVE_TIMEOUT_MS),
+    ("grpc.http2.max_pings_without_data", 0),
+    ("grpc.max_concurrent_streams", GRPC_MAX_CONCURRENT_STREAMS),
+    ("grpc.so_reuseport", 1)
+]
+
+# Port for the Prometheus /metrics endpoint (0 disables it) and the share of RPCs whose latency is recorded.
+# Metrics live in each process's memory, so server process N serves them on METRICS_PORT + N.
+METRICS_PORT = int(os.getenv("METRICS_PORT", "9100"))
+METRICS_SAMPLE_RATE = float(os.getenv("METRICS_SAMPLE_RATE", "0.01"))
+
+# Fed by the background refresher and sampled RPCs only - never per request
+QUEUE_WAIT_LENGTH = Gauge("bull_queue_wait_length", "Jobs in the wait list", ["wait_list"])
+QUEUE_ACTIVE_LENGTH = Gauge("bull_queue_active_length", "Jobs in the active list", ["active_list"])
+REDIS_REFRESH_SECONDS = Histogram("bull_scaler_redis_refresh_seconds", "Duration of the pipelined queue length refresh")
+RPC_DURATION_SECONDS = Histogram("bull_scaler_rpc_duration_seconds", "Duration of sampled gRPC calls", ["method"])
+
+# RPCs beyond this many in flight are rejected with UNAVAILABLE instead of queueing
+MAX_CONCURRENT_RPCS = int(os.getenv("MAX_CONCURRENT_RPCS", str(min(32, (os.cpu_count() or 2) * 4) * 2)))
+_rpc_slots = asyncio.Semaphore(MAX_CONCURRENT_RPCS)
+
+# Upper bound on Redis connections - one per in-flight RPC plus the two background tasks
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", str(MAX_CONCURRENT_RPCS + 2)))
 
-# Initialize Redis connection
-try:
-    redis_client = redis.Redis(
+# How often the background health check PINGs Redis
+REDIS_PING_INTERVAL_SECONDS = float(os.getenv("REDIS_PING_INTERVAL_SECONDS", "5"))
+
+# Keep idle connections alive between KEDA polls instead of reconnecting
+REDIS_KEEPALIVE_OPTIONS = {socket.TCP_KEEPIDLE: 30} if hasattr(socket, "TCP_KEEPIDLE") else {}
+REDIS_HEALTH_CHECK_INTERVAL = 30
+
+# Set by connect_redis() once the server's event loop is running
+r = None
+
+# Result of the most recent PING, maintained by monitor_redis()
+_redis_up = False
+
+# Set once this process's first PING succeeds; gates the readiness probe
+_redis_ready = asyncio.Event()
+
+async def connect_redis():
+    """Create the shared Redis client and verify connectivity"""
+    global r, _redis_up
+    pool = aioredis.ConnectionPool(
         host=REDIS_HOST,
         port=REDIS_PORT,
-        decode_responses=True,
+        # LLEN replies are integers, so skip the UTF-8 decode path entirely
+        decode_responses=False,
         socket_timeout=5,
-        socket_connect_timeout=5
+        socket_connect_timeout=5,
+        socket_keepalive=True,
+        socket_keepalive_options=REDIS_KEEPALIVE_OPTIONS,
+        health_check_interval=REDIS_HEALTH_CHECK_INTERVAL,
+        retry_on_timeout=True,
+        retry=Retry(ExponentialBackoff(), 3),
+        max_connections=REDIS_MAX_CONNECTIONS
     )
-    r = VerboseRedis(redis_client)
-    r.ping()
-    logger.info(f"Successfully connected to Redis at {REDIS_HOST}:{REDIS_PORT}")
-    logger.info("External scaler ready - queue configuration will come from ScaledJob metadata")
-except redis.ConnectionError as e:
-    logger.error(f"Failed to connect to Redis at {REDIS_HOST}:{REDIS_PORT}: {e}")
-    r = None
-
-def get_metadata_value(metadata, key):
-    """Extract and validate metadata from ScaledObjectRef"""
-    if key not in metadata or not metadata[key]:
+    r = aioredis.Redis(connection_pool=pool)
+    try:
+        await r.ping()
+        _redis_up = True
+        _redis_ready.set()
+        logger.info("Successfully connected to Redis at %s:%s", REDIS_HOST, REDIS_PORT)
+        logger.info("External scaler ready - queue configuration will come from ScaledJob metadata")
+    except redis.RedisError as e:
+        logger.error("Failed to connect to Redis at %s:%s: %s", REDIS_HOST, REDIS_PORT, e)
+        _redis_up = False
+
+async def monitor_redis():
+    """PING Redis every REDIS_PING_INTERVAL_SECONDS and record whether it is reachable"""
+    global _redis_up
+    while True:
+        await asyncio.sleep(REDIS_PING_INTERVAL_SECONDS)
+        try:
+            await r.ping()
+            if not _redis_up:
+                logger.warning("Redis at %s:%s is reachable again", REDIS_HOST, REDIS_PORT)
+            _redis_up = True
+            _redis_ready.set()
+        except redis.RedisError as e:
+            if _redis_up:
+                logger.error("Redis at %s:%s became unreachable: %s", REDIS_HOST, REDIS_PORT, e)
+            _redis_up = False
+
+class QueueState:
+    """Last known lengths of one (wait_list, active_list) pair"""
+    __slots__ = ("wait_len", "active_len", "refreshed_at", "requested_at")
+
+    def __init__(self, wait_len, active_len, refreshed_at, requested_at):
+        self.wait_len = wait_len
+        self.active_len = active_len
+        self.refreshed_at = refreshed_at
+        self.requested_at = requested_at
+
+# (wait_list, active_list) -> QueueState, kept fresh by refresh_queue_lengths().
+# Only touched from the event loop thread, so no lock is needed.
+_queue_state = {}
+
+# (wait_list, active_list) -> Task reading lengths for a pair not served from _queue_state yet
+_pending_reads = {}
+
+async def llen_pairs(client, keys, raise_on_error=True):
+    """Run LLEN for every (wait_list, active_list) pair in a single round-trip.
+    Returns the lengths flattened in order: wait, active, wait, active, ...
+    With raise_on_error=False a failed command's exception takes the place of its length."""
+    async with client.pipeline(transaction=False) as pipe:
+        for wait_key, active_key in keys:
+            pipe.llen(wait_key)
+            pipe.llen(active_key)
+        return await pipe.execute(raise_on_error=raise_on_error)
+
+async def _read_queue_lengths(key, requested_at):
+    wait_len, active_len = await llen_pairs(r, [key])
+    _queue_state[key] = QueueState(wait_len, active_len, time.monotonic(), requested_at)
+    return wait_len, active_len
+
+async def get_queue_lengths(wait_list, active_list):
+    """Return (wait_len, active_len) from memory, reading Redis only for unknown or stale pairs"""
+    key = (wait_list, active_list)
+    now = time.monotonic()
+    state = _queue_state.get(key)
+    if state is not None:
+        state.requested_at = now
+        if now - state.refreshed_at < CACHE_TTL_MS / 1000:
+            return state.wait_len, state.active_len
+
+    # Concurrent callers for the same pair share a single Redis read
+    task = _pending_reads.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_read_queue_lengths(key, now))
+        _pending_reads[key] = task
+        task.add_done_callback(lambda _: _pending_reads.pop(key, None))
+    return await asyncio.shield(task)
+
+async def refresh_queue_lengths():
+    """Re-read every known pair in one pipeline each QUEUE_REFRESH_INTERVAL_MS"""
+    global _redis_up
+    while True:
+        await asyncio.sleep(QUEUE_REFRESH_INTERVAL_MS / 1000)
+        if not _queue_state or not _redis_up:
+            continue
+
+        # Forget pairs no ScaledObject has asked about for a while
+        now = time.monotonic()
+        for key in [key for key, state in _queue_state.items() if now - state.requested_at > QUEUE_IDLE_SECONDS]:
+            del _queue_state[key]
+            _forget_queue_metrics(*key)
+
+        keys = list(_queue_state)
+        started_at = time.perf_counter()
+        try:
+            # One bad key (e.g. a list name pointing at a non-list) must not fail every other pair
+            lengths = await llen_pairs(r, keys, raise_on_error=False)
+        except (redis.ConnectionError, redis.TimeoutError) as e:
+            # Report the outage once and let the interceptor answer right away instead of
+            # waiting for monitor_redis(), which will also notice when Redis is back
+            logger.error("Redis at %s:%s became unreachable: %s", REDIS_HOST, REDIS_PORT, e)
+            _redis_up = False
+            continue
+        except redis.RedisError as e:
+            # Entries go stale and requests fall back to reading Redis directly
+            logger.warning("Refreshing queue lengths failed: %s", e)
+            continue
+
+        REDIS_REFRESH_SECONDS.observe(time.perf_counter() - started_at)
+
+        refreshed_at = time.monotonic()
+        for i, key in enumerate(keys):
+            state = _queue_state.get(key)
+            if state is None:
+                continue
+            wait_len, active_len = lengths[2 * i], lengths[2 * i + 1]
+            if isinstance(wait_len, Exception) or isinstance(active_len, Exception):
+                # Stop tracking the pair; its next request reads Redis directly and reports the error
+                error = wait_len if isinstance(wait_len, Exception) else active_len
+                logger.warning("Refreshing queue lengths for %s/%s failed: %s", key[0], key[1], error)
+                del _queue_state[key]
+                _forget_queue_metrics(*key)
+                continue
+            state.wait_len = wait_len
+            state.active_len = active_len
+            state.refreshed_at = refreshed_at
+            QUEUE_WAIT_LENGTH.labels(key[0]).set(state.wait_len)
+            QUEUE_ACTIVE_LENGTH.labels(key[1]).set(state.active_len)
+
+def _forget_queue_metrics(wait_list, active_list):
+    # Another pair sharing a list re-creates the series on its next refresh
+    for gauge, name in ((QUEUE_WAIT_LENGTH, wait_list), (QUEUE_ACTIVE_LENGTH, active_list)):
+        try:
+            gauge.remove(name)
+        except KeyError:
+            pass
+
+def require_metadata(key, value):
+    """Validate that a ScaledObjectRef metadata value is present and return it"""
+    if not value:
         raise ValueError(f"Required metadata {key} is missing or empty")
-    return metadata[key]
+    return value
 
+@functools.lru_cache(maxsize=256)
 def validate_max_pods(max_pods_str):
     """Validate maxPods parameter"""
     try:
@@ -97,139 +289,346 @@ def validate_max_pods(max_pods_str):
             raise e
         raise ValueError(f"maxPods must be a valid integer, got: {max_pods_str}")
 
+@functools.lru_cache(maxsize=1024)
+def _parse_queue_pair(wait_list, active_list):
+    """Validate waitList and activeList and return (wait_list, active_list)"""
+    return require_metadata("waitList", wait_list), require_metadata("activeList", active_list)
+
+@functools.lru_cache(maxsize=1024)
+def _parse_metadata_triple(wait_list, active_list, max_pods_str):
+    """Validate waitList, activeList and maxPods and return (wait_list, active_list, max_pods)"""
+    wait_list, active_list = _parse_queue_pair(wait_list, active_list)
+    return wait_list, active_list, validate_max_pods(require_metadata("maxPods", max_pods_str))
+
+# Constant responses are built once and shared - they are never modified after creation
+_METRIC_SPEC_RESPONSE = externalscaler_pb2.GetMetricSpecResponse(metricSpecs=[
+    externalscaler_pb2.MetricSpec(metricName="bull_queue_length", targetSize=1)
+])
+_INACTIVE_RESPONSE = externalscaler_pb2.IsActiveResponse(result=False)
+_ACTIVE_RESPONSE = externalscaler_pb2.IsActiveResponse(result=True)
+
+def _build_metrics_response(metric_value):
+    return externalscaler_pb2.GetMetricsResponse(metricValues=[
+        externalscaler_pb2.MetricValue(metricName="bull_queue_length", metricValue=metric_value)
+    ])
+
+# GetMetrics only ever varies in one small integer, so common responses are serialized
+# up front and handed to gRPC as bytes (see _serialize_metrics_response)
+_SERIALIZED_METRICS_RESPONSES = [_build_metrics_response(i).SerializeToString() for i in range(1025)]
+_ZERO_METRICS_RESPONSE = _SERIALIZED_METRICS_RESPONSES[0]
+
+def _serialize_metrics_response(response):
+    return response if isinstance(response, bytes) else response.SerializeToString()
+
+# One summary line per successful request, logged at INFO
+_IS_ACTIVE_SUMMARY = "rpc=IsActive scaled_object=%s/%s wait_list=%s active_list=%s wait=%d active=%d result=%s dur_us=%d"
+_GET_METRIC_SPEC_SUMMARY = "rpc=GetMetricSpec scaled_object=%s/%s"
+_GET_METRICS_SUMMARY = "rpc=GetMetrics scaled_object=%s/%s wait_list=%s active_list=%s wait=%d active=%d max_pods=%d result=%d dur_us=%d"
+
 class ExternalScalerServicer(externalscaler_pb2_grpc.ExternalScalerServicer):
 
-    def IsActive(self, request, context):
+    async def IsActive(self, request, context):
         """
         Returns true if there is at least one item in either wait or active list.
         """
-        logger.info(f"[GRPC] IsActive called for ScaledObject: {request.namespace}/{request.name}")
+        start = time.perf_counter_ns()
         try:
-            if r is None:
-                logger.error("[IS-ACTIVE] Redis connection not available")
-                return externalscaler_pb2.IsActiveResponse(result=False)
-
             # Get queue names from metadata
             try:
-                wait_list = get_metadata_value(request.scalerMetadata, "waitList")
-                active_list = get_metadata_value(request.scalerMetadata, "activeList")
+                md = request.scalerMetadata
+                wait_list, active_list = _parse_queue_pair(md.get("waitList", ""), md.get("activeList", ""))
             except ValueError as e:
-                logger.error(f"[IS-ACTIVE] Metadata error: {e}")
+                logger.error("[IS-ACTIVE] Metadata error: %s", e)
                 context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
                 context.set_details(str(e))
-                return externalscaler_pb2.IsActiveResponse(result=False)
+                return _INACTIVE_RESPONSE
 
-            logger.info(f"[IS-ACTIVE] Using queues: wait='{wait_list}', active='{active_list}'")
-
-            wait_len = r.llen(wait_list)
-            active_len = r.llen(active_list)
+            wait_len, active_len = await get_queue_lengths(wait_list, active_list)
             total = wait_len + active_len
             result = total > 0
 
-            logger.info(f"[IS-ACTIVE] Result: wait={wait_len}, active={active_len}, total={total}, is_active={result}")
-            return externalscaler_pb2.IsActiveResponse(result=result)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(_IS_ACTIVE_SUMMARY, request.namespace, request.name, wait_list, active_list,
+                            wait_len, active_len, result, (time.perf_counter_ns() - start) // 1000)
+            return _ACTIVE_RESPONSE if result else _INACTIVE_RESPONSE
         except Exception as e:
-            logger.error(f"[IS-ACTIVE] Error: {e}")
+            logger.error("[IS-ACTIVE] Error: %s", e)
             context.set_code(grpc.StatusCode.INTERNAL)
             context.set_details(f"Failed to check if active: {str(e)}")
-            return externalscaler_pb2.IsActiveResponse(result=False)
+            return _INACTIVE_RESPONSE
 
-    def GetMetricSpec(self, request, context):
+    async def GetMetricSpec(self, request, context):
         """
         Returns the metric spec for KEDA. Each pod handles 1 job.
         """
-        logger.info(f"[GRPC] GetMetricSpec called for ScaledObject: {request.namespace}/{request.name}")
-        try:
-            metric_spec = externalscaler_pb2.MetricSpec(
-                metricName="bull_queue_length",
-                targetSize=1
-            )
-            logger.info(f"[GET-METRIC-SPEC] Returning spec: metricName=bull_queue_length, targetSize=1")
-            return externalscaler_pb2.GetMetricSpecResponse(metricSpecs=[metric_spec])
-        except Exception as e:
-            logger.error(f"[GET-METRIC-SPEC] Error: {e}")
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(f"Failed to get metric spec: {str(e)}")
-            return externalscaler_pb2.GetMetricSpecResponse()
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(_GET_METRIC_SPEC_SUMMARY, request.namespace, request.name)
+        return _METRIC_SPEC_RESPONSE
 
-    def GetMetrics(self, request, context):
+    async def GetMetrics(self, request, context):
         """
         Returns the current metric value: total jobs in wait+active, capped at maxPods.
         """
-        logger.info(f"[GRPC] GetMetrics called for ScaledObject: {request.scaledObjectRef.namespace}/{request.scaledObjectRef.name}")
+        start = time.perf_counter_ns()
         try:
-            if r is None:
-                logger.error("[GET-METRICS] Redis connection not available")
-                metric_value = externalscaler_pb2.MetricValue(
-                    metricName="bull_queue_length",
-                    metricValue=0
-                )
-                return externalscaler_pb2.GetMetricsResponse(metricValues=[metric_value])
-
             # Get configuration from metadata
             try:
-                wait_list = get_metadata_value(request.scaledObjectRef.scalerMetadata, "waitList")
-                active_list = get_metadata_value(request.scaledObjectRef.scalerMetadata, "activeList")
-                max_pods_str = get_metadata_value(request.scaledObjectRef.scalerMetadata, "maxPods")
-                max_pods = validate_max_pods(max_pods_str)
+                # Read the protobuf map once; KEDA sends identical metadata on every poll
+                md = request.scaledObjectRef.scalerMetadata
+                wait_list, active_list, max_pods = _parse_metadata_triple(
+                    md.get("waitList", ""), md.get("activeList", ""), md.get("maxPods", "")
+                )
             except ValueError as e:
-                logger.error(f"[GET-METRICS] Metadata error: {e}")
+                logger.error("[GET-METRICS] Metadata error: %s", e)
                 context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
                 context.set_details(str(e))
-                metric_value = externalscaler_pb2.MetricValue(
-                    metricName="bull_queue_length",
-                    metricValue=0
-                )
-                return externalscaler_pb2.GetMetricsResponse(metricValues=[metric_value])
-
-            logger.info(f"[GET-METRICS] Using queues: wait='{wait_list}', active='{active_list}', maxPods={max_pods}")
+                return _ZERO_METRICS_RESPONSE
 
-            wait_len = r.llen(wait_list)
-            active_len = r.llen(active_list)
+            wait_len, active_len = await get_queue_lengths(wait_list, active_list)
             total = wait_len + active_len
-            metric_value_int = min(total, max_pods)
+            metric_value_int = total if total < max_pods else max_pods
 
-            metric_value = externalscaler_pb2.MetricValue(
-                metricName="bull_queue_length",
-                metricValue=metric_value_int
-            )
-
-            logger.info(f"[GET-METRICS] Final result: wait={wait_len}, active={active_len}, total={total}, capped_value={metric_value_int}, max_pods={max_pods}")
-            return externalscaler_pb2.GetMetricsResponse(metricValues=[metric_value])
+            if logger.isEnabledFor(logging.INFO):
+                ref = request.scaledObjectRef
+                logger.info(_GET_METRICS_SUMMARY, ref.namespace, ref.name, wait_list, active_list,
+                            wait_len, active_len, max_pods, metric_value_int, (time.perf_counter_ns() - start) // 1000)
+            if metric_value_int < len(_SERIALIZED_METRICS_RESPONSES):
+                return _SERIALIZED_METRICS_RESPONSES[metric_value_int]
+            return _build_metrics_response(metric_value_int)
         except Exception as e:
-            logger.error(f"[GET-METRICS] Error: {e}")
+            logger.error("[GET-METRICS] Error: %s", e)
             context.set_code(grpc.StatusCode.INTERNAL)
             context.set_details(f"Failed to get metrics: {str(e)}")
-            metric_value = externalscaler_pb2.MetricValue(
-                metricName="bull_queue_length",
-                metricValue=0
-            )
-            return externalscaler_pb2.GetMetricsResponse(metricValues=[metric_value])
+            return _ZERO_METRICS_RESPONSE
 
-def serve():
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+async def _inactive(request, context):
+    return _INACTIVE_RESPONSE
 
-    # Add the external scaler servicer
-    externalscaler_pb2_grpc.add_ExternalScalerServicer_to_server(
-        ExternalScalerServicer(), server
+async def _zero_metrics(request, context):
+    return _ZERO_METRICS_RESPONSE
+
+class RedisHealthInterceptor(grpc.aio.ServerInterceptor):
+    """Answer Redis-backed RPCs with a zero result while Redis is down, without entering the servicer"""
+
+    # The request is never looked at, so it is not deserialized either
+    _FALLBACK_HANDLERS = {
+        "/externalscaler.ExternalScaler/IsActive": grpc.unary_unary_rpc_method_handler(
+            _inactive, response_serializer=externalscaler_pb2.IsActiveResponse.SerializeToString
+        ),
+        "/externalscaler.ExternalScaler/GetMetrics": grpc.unary_unary_rpc_method_handler(
+            _zero_metrics, response_serializer=_serialize_metrics_response
+        ),
+    }
+
+    async def intercept_service(self, continuation, handler_call_details):
+        if not _redis_up:
+            fallback = self._FALLBACK_HANDLERS.get(handler_call_details.method)
+            if fallback is not None:
+                return fallback
+        return await continuation(handler_call_details)
+
+def _limit_concurrency(behavior, duration):
+    async def limited(request, context):
+        if _rpc_slots.locked():
+            await context.abort(grpc.StatusCode.UNAVAILABLE, "overloaded")
+        async with _rpc_slots:
+            if random.random() >= METRICS_SAMPLE_RATE:
+                return await behavior(request, context)
+            start = time.perf_counter()
+            try:
+                return await behavior(request, context)
+            finally:
+                duration.observe(time.perf_counter() - start)
+    return limited
+
+_HEALTH_METHOD_PREFIX = f"/{health.SERVICE_NAME}/"
+
+class ConcurrencyLimitInterceptor(grpc.aio.ServerInterceptor):
+    """Reject unary RPCs with UNAVAILABLE once MAX_CONCURRENT_RPCS are in flight instead of queueing them.
+    Also records the latency of METRICS_SAMPLE_RATE of the admitted calls."""
+
+    def __init__(self):
+        # method -> wrapped handler; servicer handlers are created once, so wrap them once too
+        self._limited_handlers = {}
+
+    async def intercept_service(self, continuation, handler_call_details):
+        # Readiness probes must still be answered under overload, or the pod leaves the Service
+        if handler_call_details.method.startswith(_HEALTH_METHOD_PREFIX):
+            return await continuation(handler_call_details)
+        limited = self._limited_handlers.get(handler_call_details.method)
+        if limited is not None:
+            return limited
+        handler = await continuation(handler_call_details)
+        if handler is None or handler.unary_unary is None:
+            return handler
+        limited = grpc.unary_unary_rpc_method_handler(
+            _limit_concurrency(handler.unary_unary,
+                               RPC_DURATION_SECONDS.labels(handler_call_details.method.rsplit("/", 1)[-1])),
+            request_deserializer=handler.request_deserializer,
+            response_serializer=handler.response_serializer
+        )
+        self._limited_handlers[handler_call_details.method] = limited
+        return limited
+
+def add_servicer_to_server(servicer, server):
+    """Like the generated add_ExternalScalerServicer_to_server, but GetMetrics may return pre-serialized bytes"""
+    rpc_method_handlers = {
+        "IsActive": grpc.unary_unary_rpc_method_handler(
+            servicer.IsActive,
+            request_deserializer=externalscaler_pb2.ScaledObjectRef.FromString,
+            response_serializer=externalscaler_pb2.IsActiveResponse.SerializeToString
+        ),
+        "StreamIsActive": grpc.unary_stream_rpc_method_handler(
+            servicer.StreamIsActive,
+            request_deserializer=externalscaler_pb2.ScaledObjectRef.FromString,
+            response_serializer=externalscaler_pb2.IsActiveResponse.SerializeToString
+        ),
+        "GetMetricSpec": grpc.unary_unary_rpc_method_handler(
+            servicer.GetMetricSpec,
+            request_deserializer=externalscaler_pb2.ScaledObjectRef.FromString,
+            response_serializer=externalscaler_pb2.GetMetricSpecResponse.SerializeToString
+        ),
+        "GetMetrics": grpc.unary_unary_rpc_method_handler(
+            servicer.GetMetrics,
+            request_deserializer=externalscaler_pb2.GetMetricsRequest.FromString,
+            response_serializer=_serialize_metrics_response
+        ),
+    }
+    server.add_generic_rpc_handlers((
+        grpc.method_handlers_generic_handler("externalscaler.ExternalScaler", rpc_method_handlers),
+    ))
+
+# PIDs of forked server processes - only populated in the parent
+_child_pids = []
+
+# Set when a forked server process dies on its own, so the parent exits non-zero
+_child_failed = False
+
+# Strong references to fire-and-forget tasks so they are not garbage-collected
+_background_tasks = set()
+
+def _handle_sigterm(server):
+    logger.info("Received SIGTERM, shutting down gRPC server")
+    _shutdown(server)
+
+def _handle_sigchld(server):
+    """Reap server processes; if one exits on its own, stop the whole pod so Kubernetes restarts it"""
+    global _child_failed
+    while True:
+        try:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            return
+        if pid == 0:
+            return
+        if pid in _child_pids:
+            _child_pids.remove(pid)
+            logger.error("Server process %s exited unexpectedly with code %s, shutting down",
+                         pid, os.waitstatus_to_exitcode(status))
+            _child_failed = True
+            _shutdown(server)
+            return
+
+def _shutdown(server):
+    loop = asyncio.get_running_loop()
+    # Ignore repeated SIGTERMs while in-flight RPCs drain; children exiting from here on are expected
+    loop.remove_signal_handler(signal.SIGTERM)
+    loop.remove_signal_handler(signal.SIGCHLD)
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    for pid in _child_pids:
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+    _spawn(server.stop(SHUTDOWN_GRACE_SECONDS))
+
+async def _report_ready(health_servicer):
+    """Flip the gRPC health status to SERVING once this process has reached Redis"""
+    await _redis_ready.wait()
+    await health_servicer.set("", health_pb2.HealthCheckResponse.SERVING)
+    logger.info("Readiness probe now SERVING")
+
+def _spawn(coro):
+    task = asyncio.ensure_future(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+async def _run():
+    server = grpc.aio.server(
+        interceptors=[RedisHealthInterceptor(), ConcurrencyLimitInterceptor()],
+        options=GRPC_SERVER_OPTIONS
     )
 
+    # Add the external scaler servicer
+    add_servicer_to_server(ExternalScalerServicer(), server)
+
+    # Standard gRPC health service for the Kubernetes readiness probe. It stays
+    # NOT_SERVING until this process's first Redis PING succeeds; later outages
+    # are handled by RedisHealthInterceptor rather than by failing readiness.
+    health_servicer = health.aio.HealthServicer()
+    await health_servicer.set("", health_pb2.HealthCheckResponse.NOT_SERVING)
+    health_pb2_grpc.add_HealthServicer_to_server(health_servicer, server)
+
     # Listen on port 8080
     listen_addr = "0.0.0.0:8080"
     server.add_insecure_port(listen_addr)
 
-    logger.info(f"Starting gRPC server on {listen_addr}")
-    logger.info(f"Redis config: {REDIS_HOST}:{REDIS_PORT}")
+    logger.info("Starting gRPC server on %s", listen_addr)
+    logger.info("Redis config: %s:%s", REDIS_HOST, REDIS_PORT)
     logger.info("Queue configuration will be provided via ScaledJob metadata")
 
-    server.start()
+    await connect_redis()
+    _spawn(_report_ready(health_servicer))
+    _spawn(monitor_redis())
+    _spawn(refresh_queue_lengths())
+    await server.start()
+
+    # Stop gracefully on SIGTERM so Kubernetes' terminationGracePeriodSeconds is honored
+    asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, _handle_sigterm, server)
+    if _child_pids:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGCHLD, _handle_sigchld, server)
+        # Catch any server process that died before the handler was installed
+        _handle_sigchld(server)
 
     try:
-        while True:
-            time.sleep(86400)  # Sleep for a day
-    except KeyboardInterrupt:
+        await server.wait_for_termination()
+    except asyncio.CancelledError:
         logger.info("Shutting down gRPC server")
-        server.stop(0)
+        await server.stop(0)
+        raise
+
+def _run_process(index):
+    # Started after forking so no exporter thread crosses fork()
+    if METRICS_PORT:
+        start_http_server(METRICS_PORT + index)
+        logger.info("Serving Prometheus metrics on port %s", METRICS_PORT + index)
+    try:
+        asyncio.run(_run())
+    except KeyboardInterrupt:
+        pass
+
+def serve():
+    """Run SERVER_PROCESSES copies of the server, each with its own event loop and Redis pool"""
+    for index in range(1, SERVER_PROCESSES):
+        # Fork before any event loop or Redis connection exists so nothing is shared
+        pid = os.fork()
+        if pid == 0:
+            _child_pids.clear()
+            _run_process(index)
+            os._exit(0)
+        _child_pids.append(pid)
+
+    try:
+        _run_process(0)
+    finally:
+        for pid in _child_pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+                os.waitpid(pid, 0)
+            except (ProcessLookupError, ChildProcessError):
+                pass
+    if _child_failed:
+        sys.exit(1)
 
 if __name__ == "__main__":
     serve()